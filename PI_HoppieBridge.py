@@ -8,7 +8,7 @@ This X-Plane plugin exposes eleven string datarefs used to integrate with Hoppie
     hoppiebridge/send_message_type — clients write message type for structured message.
     hoppiebridge/send_message_packet — clients write message packet for structured message.
     hoppiebridge/send_callsign — clients write callsign.
-    hoppiebridge/poll_frequency_fast — clients write 1 (or any non-zero value) to enable fast polling (around 15 seconds), 0 for normal polling (45 ~ 75 seconds).
+    hoppiebridge/poll_frequency_fast — clients write 1 (or any non-zero value) to enable fast polling (around 15 seconds), 0 for normal adaptive polling (45 ~ 75 seconds).
     hoppiebridge/poll_queue — read the latest received message as a JSON string.
     hoppiebridge/poll_message_origin — read the origin of the latest message received ("poll" or "response").
     hoppiebridge/poll_message_from — read the source callsign of the latest message received.
@@ -56,6 +56,8 @@ from __future__ import annotations
 import os
 import json
 import ast
+import asyncio
+import queue
 import threading
 import requests
 import operator
@@ -63,10 +65,16 @@ import random
 import re
 
 from pathlib import Path
-from typing import Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import NewConnectionError
+from typing import Optional, Any, NamedTuple
 from collections import deque
-from datetime import datetime, timezone
-from time import perf_counter
+from dataclasses import dataclass, field
+from itertools import count
+from concurrent.futures import Future
+from functools import partial
+from time import perf_counter, strftime, gmtime
 
 try:
     import xp
@@ -75,6 +83,11 @@ except ImportError:
     print('xp module not found')
     pass
 
+try:
+    import orjson  # optional, faster binary JSON
+except ImportError:
+    orjson = None
+
 # Version
 __VERSION__ = 'v2.2'
 
@@ -85,10 +98,36 @@ plugin_desc = 'Simple Python script to add drefs for Hoppie\'s ACARS'
 
 # Loopback Schedule
 DEFAULT_SCHEDULE = 5  # positive numbers are seconds, 0 disabled, negative numbers are cycles
+ASYNC_SCHEDULE = 1    # seconds, while a connection task is pending
+IDLE_SCHEDULE = 30    # seconds, while no logon is set
+OFF_SCHEDULE = 10     # seconds, while avionics are off
+MIN_SCHEDULE = 0.5    # seconds, lower bound for the adaptive schedule
 
 # ACARS poll frequency schedule
 POLL_DEFAULT_SCHEDULE = (45, 75)  # seconds
 POLL_FAST_SCHEDULE = (12, 18)     # seconds
+POLL_STEP = 10                    # seconds added to the adaptive interval after an empty poll
+POLL_JITTER = 0.15                # +/- fraction applied to the adaptive interval
+POLL_RETRY = 10                   # seconds between polls while communication is not established
+
+# outbox queue
+OUTBOX_SIZE = 64      # max queued outbound messages, oldest dropped first
+SEND_BATCH_SIZE = 10  # max messages sent back to back by a single task
+SEND_ATTEMPTS = 3     # max send attempts before a message is dropped
+SEND_BACKOFF = 5      # seconds, base of the exponential retry backoff
+
+# info request replies (METAR, ATIS, ...)
+INFO_CACHE_TTL = 1800  # seconds a reply is served from memory
+INFO_CACHE_SIZE = 16   # max cached replies, least recently used dropped first
+
+# HTTP
+HTTP_TIMEOUT = (3.05, 10)  # seconds, (connect, read)
+HTTP_POOL_SIZE = 2         # one send and one poll in flight at most
+
+# message types accepted by the ACARS servers
+MESSAGE_TYPES = frozenset({
+    'progress', 'cpdlc', 'telex', 'ping', 'inforeq', 'posreq', 'position', 'datareq', 'poll', 'peek'
+})
 
 # servers
 HOPPIE = 'https://www.hoppie.nl/acars/system/connect.html'
@@ -96,6 +135,7 @@ SAYINTENTIONS = 'https://acars.sayintentions.ai/acars/system/connect.html'
 
 # debug 
 DEBUG = False
+SLOW_CALLBACK = 0.05  # seconds, loopCallback runs longer than this are always logged
 
 def log(msg: str) -> None:
     xp.log(msg)
@@ -111,15 +151,27 @@ HOPPIE_PATTERN = re.compile(
     r'\{([^\s]+)\s+([^\s]+)\s+\{(.+?)\}\}',
     re.DOTALL
 )
+JSON_START = re.compile(r'\s*\{')
 
 try:
     FONT = xp.Font_Proportional
     FONT_WIDTH, FONT_HEIGHT, _ = xp.getFontDimensions(FONT)
     PREF_PATH = Path(xp.getPrefsPath()).parent
+    # printable ASCII widths, measured once: text_width() sums them without crossing into the SDK
+    CHAR_WIDTHS = {chr(c): xp.measureString(FONT, chr(c)) for c in range(32, 127)}
     debug(f"font width: {FONT_WIDTH} | height: {FONT_HEIGHT}", "INIT")
 except NameError:
     FONT_WIDTH, FONT_HEIGHT = 10, 10
     PREF_PATH = Path(os.path.dirname(__file__)).parent
+    CHAR_WIDTHS = {}
+
+
+def text_width(text: str) -> float:
+    """Pixel width of text in FONT, from the ASCII width table when possible"""
+    try:
+        return sum(CHAR_WIDTHS[c] for c in text)
+    except KeyError:
+        return xp.measureString(FONT, text)
 
 # aliases
 Message = dict[str, Any]
@@ -127,15 +179,31 @@ ParsedMessage = tuple[Optional[str], Optional[str], Optional[str], Optional[str]
 
 # safe attrgetter with default value
 def safe_attrgetter(path, default=None):
+    get = operator.attrgetter(path)  # built once, not on every property read
+
     def getter(obj):
         try:
-            return operator.attrgetter(path)(obj)
+            return get(obj)
         except Exception as e:
             log(f"**** {path} Error: {e}")
             return default
     return getter
 
 
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def json_loads_bytes(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def random_connection_time(min: int = 45, max: int = 75) -> int:
     """Calculate a random connection time between 45 and 75 seconds."""
     return random.randint(min, max)
@@ -144,14 +212,10 @@ def random_connection_time(min: int = 45, max: int = 75) -> int:
 def looks_like_json(raw: str) -> bool:
     """
     Cheap heuristic:
-    - starts with '{'
-    - contains at least one double-quoted key
+    - first non-blank character is '{'
+    - no full scan: a single-quoted dict is rejected by the JSON parser at its first key
     """
-    if not raw:
-        return False
-
-    s = raw.lstrip()
-    return s.startswith('{') and ':' in s and '"' in s
+    return bool(raw) and JSON_START.match(raw) is not None
 
 
 def parse_message(raw: str) -> Message:
@@ -173,11 +237,14 @@ def parse_message(raw: str) -> Message:
     # 1) Try JSON only if it actually looks like JSON
     if looks_like_json(raw):
         try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
+            return json_loads_bytes(raw)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
             pass  # fall through
 
-    # 2) Try Python literal (safe)
+    # 2) Try Python literal (safe): only a dict display can yield a dict, skip building an AST otherwise
+    if not raw.startswith('{'):
+        log(f"**** Cannot parse message: {raw!r}")
+        return {}
     try:
         value = ast.literal_eval(raw)
         return value if isinstance(value, dict) else {}
@@ -190,7 +257,7 @@ def format_message(msg: dict | str) -> str:
     """Convert Python dict or string into a string suitable for ACARS/X-Plane."""
     if isinstance(msg, dict):
         try:
-            return json.dumps(msg)   # valid JSON
+            return json_dumps_bytes(msg).decode('utf-8')   # valid JSON
         except (TypeError, ValueError):
             return str(msg)          # last resort
     return str(msg)
@@ -249,8 +316,32 @@ def split_hoppie_poll(raw: str) -> list[str]:
     return [m.group(0) for m in HOPPIE_PATTERN.finditer(raw)]
 
 
+class OutboxStatus:
+    """Lifecycle of a queued outbound message"""
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    SENT = 'sent'
+
+
+@dataclass(slots=True)
+class OutboxMsg:
+    """Outbound message queued for sending, with its delivery state"""
+    payload: Message
+    id: int = field(default_factory=count(1).__next__)
+    status: str = OutboxStatus.PENDING
+    attempts: int = 0
+    locked_until: float = 0.0  # retry backoff: not sent again before this time
+
+
 class Dref:
     """Adapter around XPPython3 DataRefs used by HoppieBridge."""
+    # every instance attribute must be listed here
+    __slots__ = (
+        '_send_queue', '_send_message_to', '_send_message_type', '_send_message_packet', '_send_callsign',
+        '_poll_frequency_fast', '_poll_queue', '_poll_message_origin', '_poll_message_from',
+        '_poll_message_type', '_poll_message_packet', '_poll_queue_clear', '_callsign', '_comm_ready',
+        '_avionics', '_callsign_str', '_inbox_data',
+    )
 
     def __init__(self) -> None:
         # created datarefs
@@ -259,7 +350,7 @@ class Dref:
         self._send_message_type = create_dataref('hoppiebridge/send_message_type', 'string')
         self._send_message_packet = create_dataref('hoppiebridge/send_message_packet', 'string')
         self._send_callsign = create_dataref('hoppiebridge/send_callsign', 'string')
-        self._poll_frequency_fast = create_dataref('hoppiebridge/poll_frequency_fast', 'number')  # 0 = normal (45 ~ 75 seconds), 1 = fast (around 15 seconds)
+        self._poll_frequency_fast = create_dataref('hoppiebridge/poll_frequency_fast', 'number')  # 0 = normal adaptive (45 ~ 75 seconds), 1 = fast (around 15 seconds)
         self._poll_queue = create_dataref('hoppiebridge/poll_queue', 'string')  # legacy raw queue
         self._poll_message_origin = create_dataref('hoppiebridge/poll_message_origin', 'string')
         self._poll_message_from = create_dataref('hoppiebridge/poll_message_from', 'string')
@@ -287,6 +378,11 @@ class Dref:
         self._callsign.value = ""
         self._comm_ready.value = 0
 
+        # stripped copy of callsign: read-only for clients (they write send_callsign)
+        self._callsign_str = ""
+        # decoded copy of poll_queue: only the plugin writes it, so reads skip the dataref and the parse
+        self._inbox_data = {}
+
     @property
     def avionics_powered(self) -> bool:
         """True if avionics are powered on."""
@@ -295,19 +391,23 @@ class Dref:
     @property
     def callsign(self) -> str:
         """Get the callsign"""
-        debug(f'  ** _callsign: {self._callsign.value} | type: {type(self._callsign.value)} | len: {len(self._callsign.value)}', "DREF")
-        return str(self._callsign.value or "").strip()
+        if DEBUG:
+            debug(f'  ** _callsign: {self._callsign_str} | len: {len(self._callsign_str)}', "DREF")
+        return self._callsign_str
 
     @callsign.setter
     def callsign(self, value: str) -> None:
         """Set the callsign"""
-        debug(f'  ** set _callsign: {value} | type: {type(value)}', "DREF")
+        if DEBUG:
+            debug(f'  ** set _callsign: {value} | type: {type(value)}', "DREF")
         self._callsign.value = value
+        self._callsign_str = str(value or "").strip()
 
     @property
     def send_callsign(self) -> str:
         """Return send callsign request status"""
-        debug(f'  ** _send_callsign: {self._send_callsign.value} | type: {type(self._send_callsign.value)}', "DREF")
+        if DEBUG:
+            debug(f'  ** _send_callsign: {self._send_callsign.value} | type: {type(self._send_callsign.value)}', "DREF")
         return str(self._send_callsign.value or "").strip()
 
     @send_callsign.setter
@@ -328,24 +428,26 @@ class Dref:
     @property
     def inbox(self) -> dict:
         """Return decoded inbox messages"""
-        debug(f'  ** _poll_queue: {self._poll_queue.value} | type: {type(self._poll_queue.value)} | dim: {self._poll_queue._dim} | len: {len(self._poll_queue.value)}', "DREF")
-        return parse_message(self._poll_queue.value)
+        if DEBUG:
+            debug(f'  ** _poll_queue: {self._inbox_data}', "DREF")
+        return self._inbox_data
 
     @inbox.setter
     def inbox(self, message: dict | str) -> None:
         """Set inbox with a message (encoded before storing)"""
-        debug(f'  ** add_to_inbox: {message} | type: {type(message)}', "DREF")
+        if DEBUG:
+            debug(f'  ** add_to_inbox: {message} | type: {type(message)}', "DREF")
         formatted = format_message(message)
         self._poll_queue.value = formatted
         # parse message and set subfields
         if message == "" or not formatted.strip():
+            data = {}
             origin, source, msg_type, packet = "", "", "", ""
         else:
-            try:
-                data = parse_message(formatted)
-            except ValueError:
-                data = {}
+            # dicts were just serialized: no need to decode them back
+            data = message if isinstance(message, dict) else parse_message(formatted)
             origin, source, msg_type, packet = parse_hoppie_message(data)
+        self._inbox_data = data
         self._poll_message_origin.value = origin or ""
         self._poll_message_from.value = source or ""
         self._poll_message_type.value = msg_type or ""
@@ -372,7 +474,7 @@ class Dref:
             debug("ACARS outbox: incomplete structured message, ignoring", "DREF")
 
         # 2. Legacy raw queue
-        raw = self._send_queue.value.strip()
+        raw = self.send_queue
         if raw:
             return parse_message(raw)
 
@@ -391,10 +493,21 @@ class Dref:
         # Clear legacy queue
         self._send_queue.value = ""
 
+    @property
+    def send_queue(self) -> str:
+        """Return the raw legacy outbox string"""
+        return self._send_queue.value.strip()
+
+    @send_queue.setter
+    def send_queue(self, value: str) -> None:
+        """Set the raw legacy outbox string"""
+        self._send_queue.value = value
+
     @property
     def clear_inbox(self) -> bool:
         """Return clear inbox request status"""
-        debug(f'  ** _poll_queue_clear: {self._poll_queue_clear.value} | type: {type(self._poll_queue_clear.value)}', "DREF")
+        if DEBUG:
+            debug(f'  ** _poll_queue_clear: {self._poll_queue_clear.value} | type: {type(self._poll_queue_clear.value)}', "DREF")
         return bool(self._poll_queue_clear.value)
 
     @clear_inbox.setter
@@ -413,41 +526,88 @@ class Dref:
         self._comm_ready.value = int(bool(value))
 
 
-class Async(threading.Thread):
-    """Async thread to handle connection to Hoppie's ACARS"""
+class Result(NamedTuple):
+    """Outcome of a connection task: ok is False only if the task itself raised"""
+    ok: bool
+    payload: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
 
-    def __init__(self, task, *args, **kwargs) -> None:
+class Worker(threading.Thread):
+    """Background thread running the asyncio event loop that drives server connections"""
+
+    def __init__(self) -> None:
         super().__init__(daemon=True)
-        self.task = task
-        self.args = args
-        self.kwargs = kwargs
+        self.loop = asyncio.new_event_loop()
         self.cancel = threading.Event()
-        self.elapsed = 0.0
-        self.result = None
-
-    @property
-    def pending(self) -> bool:
-        return self.is_alive()
+        self.results = queue.Queue()  # (kind, Result) of completed tasks
 
     def run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def execute(self, task, *args, **kwargs) -> Result:
         start = perf_counter()
         try:
-            self.result = self.task(*self.args, **self.kwargs)
+            payload = await self.run_in_thread(partial(task, *args, **kwargs))
+            result = Result(True, payload)
         except Exception as e:
-            self.result = e
-        finally:
-            self.elapsed = perf_counter() - start
-            debug(f"Async task {self.task.__name__} completed in {self.elapsed:.3f} seconds", "ASYNC")
+            result = Result(False, error=str(e))
+        result = result._replace(elapsed=perf_counter() - start)
+        if DEBUG:
+            debug(f"Async task {task.__name__} completed in {result.elapsed:.3f} seconds", "ASYNC")
+        return result
+
+    def run_in_thread(self, call) -> asyncio.Future:
+        """Run a blocking call off the sim thread, on a daemon thread so that a request
+        still in flight never holds up X-Plane's exit (executor threads are joined at exit)"""
+        future = self.loop.create_future()
 
-    def stop(self) -> None:
-        """Stop the async task (not really, best effort only)"""
+        def settle(payload: Any, error: Optional[BaseException]) -> None:
+            if future.done():
+                return
+            if error is None:
+                future.set_result(payload)
+            else:
+                future.set_exception(error)
+
+        def target() -> None:
+            try:
+                outcome = (call(), None)
+            except Exception as e:
+                outcome = (None, e)
+            try:
+                self.loop.call_soon_threadsafe(settle, *outcome)
+            except RuntimeError:  # event loop closed meanwhile
+                pass
+
+        threading.Thread(target=target, name='HoppieBridge-request', daemon=True).start()
+        return future
+
+    def submit(self, kind: str, task, *args, **kwargs) -> Future:
+        """Schedule task on the event loop; its outcome is pushed to results when done"""
+        def done(future: Future) -> None:
+            if not future.cancelled():
+                self.results.put((kind, future.result()))
+
+        future = asyncio.run_coroutine_threadsafe(self.execute(task, *args, **kwargs), self.loop)
+        future.add_done_callback(done)
+        return future
+
+    def stop(self, timeout: float = 0.1) -> None:
+        """Request cooperative cancellation, waiting at most timeout seconds"""
         self.cancel.set()
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
         if self.is_alive():
-            self.join(3)
+            self.join(timeout)
 
 
 class Bridge:
     """Connection to Server's ACARS"""
+    __slots__ = ()
+
     _session: requests.Session | None = None
 
     @classmethod
@@ -455,50 +615,117 @@ class Bridge:
         if cls._session is None:
             s = requests.Session()
             s.headers.update({'User-Agent': f'HoppieBridge/{__VERSION__}'})
+            # retry connection failures only: a POST that reached the server must not be sent twice
+            adapter = HTTPAdapter(
+                pool_connections=2, pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3)
+            )
+            s.mount('https://', adapter)
+            s.mount('http://', adapter)
             cls._session = s
         return cls._session
 
-    def __init__(self, url: str, message: dict, poll_payload: dict) -> None:
-        self.url = url
-        self.message = message
-        self.poll_payload = poll_payload
+    @classmethod
+    def close(cls) -> None:
+        """Close the shared session and its kept-alive connections."""
+        if cls._session is not None:
+            cls._session.close()
+            cls._session = None
 
     @staticmethod
-    def run(url: str, message: Optional[dict] = None, poll_payload: Optional[dict] = None) -> dict:
-        bridge = Bridge(url=url, message=message or {}, poll_payload=poll_payload or {})
+    def run(url: str, message: Optional[dict] = None, poll_payload: Optional[dict] = None,
+            cancel: Optional[threading.Event] = None) -> dict:
         response = {}
         try:
             if message:
-                return bridge.query(message)
+                return Bridge.query(url, message, cancel)
             if poll_payload:
-                return bridge.poll()
+                return Bridge.poll(url, poll_payload, cancel)
         except requests.Timeout:
             response = {'error': "Connection Timeout"}
         except requests.RequestException as e:
             response = {'error': f"Connection Error: {str(e)}"}
         return response
 
-    def query(self, message: dict) -> dict:
+    @staticmethod
+    def send_batch(url: str, messages: list[dict], cancel: Optional[threading.Event] = None) -> list[dict]:
+        """Send messages back to back over the shared keep-alive session, one result each."""
+        # the ACARS protocol takes a single message per request
+        return [Bridge.run(url, message=message, cancel=cancel) for message in messages]
+
+    @staticmethod
+    def cancelled(cancel: Optional[threading.Event]) -> bool:
+        return cancel is not None and cancel.is_set()
+
+    @staticmethod
+    def read(response: requests.Response, cancel: Optional[threading.Event] = None) -> Optional[bytes]:
+        """Read a streamed response body, giving up as soon as cancellation is requested."""
+        chunks = []
+        with response:
+            for chunk in response.iter_content(chunk_size=1024):
+                if Bridge.cancelled(cancel):
+                    return None
+                chunks.append(chunk)
+        return b''.join(chunks)
+
+    @staticmethod
+    def decode(response: requests.Response, body: bytes) -> str:
+        return body.decode(response.encoding or 'utf-8', errors='replace')
+
+    @staticmethod
+    def not_connected(e: requests.ConnectionError) -> bool:
+        """True if the connection was never established, so the request cannot have reached the server"""
+        if isinstance(e, requests.ConnectTimeout):
+            return True
+        # requests wraps urllib3's MaxRetryError: its reason tells a refused or unresolved
+        # connection (NameResolutionError is a NewConnectionError) from a dropped one
+        reason = getattr(e.args[0], 'reason', None) if e.args else None
+        return isinstance(reason, NewConnectionError)
+
+    @staticmethod
+    def query(url: str, message: dict, cancel: Optional[threading.Event] = None) -> dict:
         if not isinstance(message, dict):
             return {'error': 'Message must be a dictionary'}
+        # 'retry' marks the failures where the message provably never left the client:
+        # anything else may have reached the server and must not be sent twice
+        if Bridge.cancelled(cancel):
+            return {'error': 'Cancelled', 'retry': True}
         try:
-            response = self.session().post(self.url, data=message, timeout=(15, 15))
-            if response.status_code != 200:
-                return {'error': f"Failed to send message: {response.status_code} {response.reason}"}
-            if 'ok' not in response.text.lower():
-                return {'error': f"Message Error: {response.text}"}
-            return {'response': response.text}
+            response = Bridge.session().post(url, data=message, timeout=HTTP_TIMEOUT, stream=True)
+        except requests.ConnectionError as e:
+            return {'error': f"Connection Error: {str(e)}", 'retry': Bridge.not_connected(e)}
         except requests.Timeout:
             return {'error': "Timeout occurred while sending message"}
         except requests.RequestException as e:
             return {'error': f"Request Error: {str(e)}"}
+        try:
+            if response.status_code != 200:
+                response.close()
+                return {'error': f"Failed to send message: {response.status_code} {response.reason}"}
+            body = Bridge.read(response, cancel)
+            if body is None:
+                return {'error': 'Cancelled'}
+            # server replies always start with 'ok' or 'error': inspect the head only
+            if not body[:8].lstrip().lower().startswith(b'ok'):
+                return {'error': f"Message Error: {Bridge.decode(response, body)}"}
+            return {'response': Bridge.decode(response, body)}
+        except requests.RequestException as e:
+            # the response was started: the server has the message
+            return {'error': f"Request Error: {str(e)}"}
 
-    def poll(self) -> dict:
+    @staticmethod
+    def poll(url: str, poll_payload: dict, cancel: Optional[threading.Event] = None) -> dict:
+        if Bridge.cancelled(cancel):
+            return {'error': 'Cancelled'}
         try:
-            response = self.session().post(self.url, data=self.poll_payload, timeout=(15, 15))
+            response = Bridge.session().post(url, data=poll_payload, timeout=HTTP_TIMEOUT, stream=True)
             if response.status_code != 200:
+                response.close()
                 return {'error': f"Failed to poll data: {response.status_code} {response.reason}"}
-            return {'poll': response.text}
+            body = Bridge.read(response, cancel)
+            if body is None:
+                return {'error': 'Cancelled'}
+            return {'poll': Bridge.decode(response, body)}
         except requests.Timeout:
             return {'error': "Timeout occurred while polling data"}
         except requests.RequestException as e:
@@ -513,8 +740,14 @@ class FloatingWidget:
     HEIGHT_MIN = 100
     MARGIN = 10
     HEADER = 16
+    CR = LINE + MARGIN  # carriage return: one line plus spacing
 
-    left, top, right, bottom = 0, 0, 0, 0
+    # every instance attribute must be listed here
+    __slots__ = (
+        'left', 'top', 'right', 'bottom',
+        'widget', 'window', 'popout_button', 'pilot_info_subwindow', 'info_line', 'content_widget',
+        'server_check', 'logon_caption', 'logon_input', 'save_button', 'edit_button', 'descriptors',
+    )
 
     def __init__(self, title: str, x: int, y: int, width: int = WIDTH, height: int = HEIGHT) -> None:
 
@@ -530,9 +763,12 @@ class FloatingWidget:
         self.content_widget = {
             'subwindow': None,
             'title': None,
-            'lines': []
+            'lines': [],      # caption pool, created once in add_content_widget and reused
+            'used': 0,        # number of pool lines currently holding text
+            'visible': True   # subwindow, title and lines are shown and hidden together
         }
         self.server_check = {}
+        self.descriptors = {}  # last descriptor set on each caption, to skip SDK reads
 
         # main widget
         self.widget = xp.createWidget(
@@ -557,17 +793,19 @@ class FloatingWidget:
 
     @property
     def content_width(self) -> int:
-        l, _, r, _ = self.get_subwindow_margins()
-        return r - l
-
-    @staticmethod
-    def cr() -> int:
-        return FloatingWidget.LINE + FloatingWidget.MARGIN
-
-    @staticmethod
-    def check_widget_descriptor(widget, text: str) -> None:
-        if text not in xp.getWidgetDescriptor(widget):
-            xp.setWidgetDescriptor(widget, text)
+        # same as the horizontal subwindow margins, without computing the vertical ones
+        return self.right - self.left - 2*self.MARGIN
+
+    def set_descriptor(self, widget, text: str) -> bool:
+        """Set widget descriptor if it changed since last set, return True if it did"""
+        if self.descriptors.get(widget) == text:
+            return False
+        xp.setWidgetDescriptor(widget, text)
+        self.descriptors[widget] = text
+        return True
+
+    def check_widget_descriptor(self, widget, text: str) -> None:
+        if self.set_descriptor(widget, text):
             xp.showWidget(widget)
 
     @classmethod
@@ -591,14 +829,14 @@ class FloatingWidget:
                 1, "TEST", 0, self.widget, xp.WidgetClass_Caption
             )
             xp.setWidgetProperty(self.info_line, xp.Property_CaptionLit, 1)
-            self.top -= self.cr()
+            self.descriptors[self.info_line] = "TEST"
+            self.top -= self.CR
 
     def check_info_line(self, message: str = "TEST") -> None:
-        if xp.getWidgetDescriptor(self.info_line) != message:
-            xp.setWidgetDescriptor(self.info_line, message)
+        self.set_descriptor(self.info_line, message)
 
     def add_button(self, text: str, subwindow: bool = False, align: str = 'left'):
-        width = int(xp.measureString(FONT, text)) + FONT_WIDTH*4
+        width = int(text_width(text)) + FONT_WIDTH*4
         if align == 'left':
             l, r = self.left + subwindow*self.MARGIN, self.left + width + subwindow*self.MARGIN
         else:
@@ -616,31 +854,32 @@ class FloatingWidget:
         )
 
     def add_user_info_widget(self) -> None:
+        line, cr = self.LINE, self.CR
         # user info subwindow
         self.pilot_info_subwindow = self.add_subwindow(lines=6)
         l, t, r, b = self.get_subwindow_margins(lines=6)
         l0 = l
         # user info widgets
         xp.createWidget(
-            l, t, l + 90, t - self.LINE,
+            l, t, l + 90, t - line,
             1, 'SERVER:', 0, self.widget, xp.WidgetClass_Caption
         )
-        t -= self.cr()
+        t -= cr
         cw = 30
-        xp.createWidget(l, t, l + 40, t - self.LINE,
+        xp.createWidget(l, t, l + 40, t - line,
             1, 'HOPPIE', 0, self.widget, xp.WidgetClass_Caption
         )
         l += 50
         hoppie_check = xp.createWidget(
-            l, t, l + cw, t - self.LINE,
+            l, t, l + cw, t - line,
             1, '', 0, self.widget, xp.WidgetClass_Button
         )
         l = r - cw - 100
-        xp.createWidget(l, t, r - cw - 10, t - self.LINE,
+        xp.createWidget(l, t, r - cw - 10, t - line,
             1, 'SAYINTENTIONS', 0, self.widget, xp.WidgetClass_Caption
         )
         sayint_check = xp.createWidget(
-            r - cw, t, r, t - self.LINE,
+            r - cw, t, r, t - line,
             1, '', 0, self.widget, xp.WidgetClass_Button
         )
 
@@ -654,13 +893,13 @@ class FloatingWidget:
             xp.setWidgetProperty(k, xp.Property_ButtonBehavior, xp.ButtonBehaviorRadioButton)
             xp.setWidgetProperty(k, xp.Property_ButtonState, v == 'hoppie')
 
-        t -= self.cr()
+        t -= cr
         l = l0
         xp.createWidget(
-            l, t, l + 80, t - self.LINE,
+            l, t, l + 80, t - line,
             1, 'LOGON:', 0, self.widget, xp.WidgetClass_Caption
         )
-        t -= self.cr()
+        t -= cr
         s = r - 80
         self.logon_input = xp.createWidget(
             l, t, s, b,
@@ -680,28 +919,31 @@ class FloatingWidget:
             s, t, r, b,
             1, "CHANGE", 0, self.widget, xp.WidgetClass_Button
         )
-        self.top = b - self.cr()
+        self.top = b - cr
 
     def add_content_widget(self, title: str = "", lines: Optional[int] = None) -> None:
+        line, cr = self.LINE, self.CR
         self.content_widget['subwindow'] = self.add_subwindow(lines=lines)
         l, t, r, b = self.get_subwindow_margins()
         if len(title):
             # add title line
             self.content_widget['title'] = xp.createWidget(
-                l, t, r, t - self.LINE,
+                l, t, r, t - line,
                 1, title, 0, self.widget, xp.WidgetClass_Caption
             )
-            t -= self.cr()
-        # add content lines
-        while t > b:
-            self.content_widget['lines'].append(
-                xp.createWidget(l, t, r, t - self.LINE,
-                                1, '--', 0, self.widget, xp.WidgetClass_Caption)
-            )
-            t -= self.LINE
+            t -= cr
+        # add content lines: as many as fit above the bottom margin
+        count = max(0, -((b - t) // line))
+        self.content_widget['lines'] = [
+            xp.createWidget(l, t - i*line, r, t - (i + 1)*line,
+                            1, '--', 0, self.widget, xp.WidgetClass_Caption)
+            for i in range(count)
+        ]
+        self.descriptors.update(dict.fromkeys(self.content_widget['lines'], '--'))
 
     def show_content_widget(self) -> None:
-        if not xp.isWidgetVisible(self.content_widget['subwindow']):
+        if not self.content_widget['visible']:
+            self.content_widget['visible'] = True
             xp.showWidget(self.content_widget['subwindow'])
             if self.content_widget['title']:
                 xp.showWidget(self.content_widget['title'])
@@ -709,31 +951,23 @@ class FloatingWidget:
                 xp.showWidget(el)
 
     def hide_content_widget(self) -> None:
-        if xp.isWidgetVisible(self.content_widget['subwindow']):
+        if self.content_widget['visible']:
+            self.content_widget['visible'] = False
             xp.hideWidget(self.content_widget['subwindow'])
             if self.content_widget['title']:
                 xp.hideWidget(self.content_widget['title'])
             for el in self.content_widget['lines']:
                 xp.hideWidget(el)
 
-    def check_content_widget(self, lines: list[str]) -> None:
-        content = self.content_widget['lines']
-        for i, el in enumerate(lines):
-            if i < len(content):
-                text = str(el) if not isinstance(el, tuple) else  f"{el[0].upper()}: {el[1]}"
-                if not text in xp.getWidgetDescriptor(content[i]):
-                    xp.setWidgetDescriptor(content[i], text)
-
-    def populate_content_widget(self, lines: list[tuple[str, str] | str]) -> None:
-        content = self.content_widget['lines']
-        for i, el in enumerate(lines):
-            text = str(el) if not isinstance(el, tuple) else  f"{el[0].upper()}: {el[1]}"
-            xp.setWidgetDescriptor(content[i], text)
-
-    def clear_content_widget(self) -> None:
+    def update_content_widget(self, lines: list[str]) -> None:
+        """Diff-based refresh: write only the lines whose text actually changed."""
         content = self.content_widget['lines']
-        for el in content:
-            xp.setWidgetDescriptor(el, "--")
+        used = min(len(lines), len(content))
+        # pool lines past both the old and the new content are already '--'
+        count = max(used, self.content_widget['used'])
+        for i in range(count):
+            self.set_descriptor(content[i], lines[i] if i < used else "--")
+        self.content_widget['used'] = used
 
     def switch_window_position(self) -> None:
         if xp.windowIsPoppedOut(self.window):
@@ -757,7 +991,8 @@ class FloatingWidget:
             xp.setWindowIsVisible(self.window, 0)
 
     def setup_widget(self, server: str = HOPPIE, logon: Optional[str] = None) -> None:
-        debug(f"Setting up widget: server={server}, logon={logon}", "WIDGET")
+        if DEBUG:
+            debug(f"Setting up widget: server={server}, logon={logon}", "WIDGET")
         # server selection
         for k, v in self.server_check.items():
             xp.setWidgetProperty(k, xp.Property_ButtonState, v == ('hoppie' if server == HOPPIE else 'sayintentions'))
@@ -766,7 +1001,7 @@ class FloatingWidget:
             xp.hideWidget(self.logon_input)
             xp.hideWidget(self.save_button)
             text = f"***{logon[-4:]}"
-            xp.setWidgetDescriptor(self.logon_caption, text)
+            self.set_descriptor(self.logon_caption, text)
             xp.showWidget(self.logon_caption)
             xp.showWidget(self.edit_button)
         else:
@@ -778,12 +1013,23 @@ class FloatingWidget:
 
     def destroy(self) -> None:
         xp.destroyWidget(self.widget)
+        # widget ids may be reused by the SDK: forget what was set on the destroyed ones
+        self.descriptors.clear()
         # xp.destroyWindow(self.window)
 
 
 class PythonInterface:
     """Python Interface for HoppieBridge plugin"""
 
+    # every instance attribute must be listed here
+    __slots__ = (
+        'plugin_name', 'plugin_sig', 'plugin_desc',
+        'dref', 'selected_server', 'hoppie_logon', 'sayintentions_logon', 'last_poll_time',
+        'worker', 'send_task', 'poll_task', 'pending_inbox', 'pending_outbox', 'sending', '_poll_payload', 'info_cache',
+        'next_poll_time', 'poll_interval', 'now', 'loop', 'loop_id',
+        'monitor', 'monitor_callback', '_status_text', '_message_content', 'ui_dirty', 'message_handlers', 'button_handlers', 'main_menu',
+    )
+
     config_file = Path(PREF_PATH, 'hoppiebridge.prf')
 
     def __init__(self) -> None:
@@ -799,16 +1045,28 @@ class PythonInterface:
         self.hoppie_logon = ''  # hoppie logon string
         self.sayintentions_logon = ''  # sayintentions logon string
         self.last_poll_time = 0  # last poll time
-        self.async_task = False
+        self.worker = None  # connection worker, started in XPluginEnable
+        self.send_task = None  # in-flight send, if any
+        self.poll_task = None  # in-flight poll, if any
         self.pending_inbox = deque()  # pending inbox messages
+        self.pending_outbox = deque(maxlen=OUTBOX_SIZE)  # OutboxMsg waiting to be sent
+        self.sending = []  # OutboxMsg handed to the in-flight send task
+        self._poll_payload = {}  # cached poll request payload
+        self.info_cache = {}  # (server, to, packet) -> (time, reply) for inforeq messages, in LRU order
 
         # status
         self.next_poll_time = 0
+        self.poll_interval = sum(POLL_DEFAULT_SCHEDULE) / 2  # adaptive (AIMD) normal poll interval
+        self.now = 0.0  # perf_counter() sampled at the start of each flight loop call
+        self.loop_id = None  # flight loop, created in XPluginEnable
 
         # widget and windows init
         self.monitor = None  # monitor window
-        self.status_text = ''  # text displayed in widget info_line
-        self.message_content = []  # content of the messages widget
+        self.message_handlers = {}  # monitor widget message -> handler
+        self.button_handlers = {}  # monitor push button -> handler
+        self._status_text = ''  # text displayed in widget info_line
+        self._message_content = []  # content of the messages widget
+        self.ui_dirty = True  # monitor needs a refresh
 
         # load settings
         self.load_settings()
@@ -816,6 +1074,26 @@ class PythonInterface:
         # create main menu and widget
         self.main_menu = self.create_main_menu()
 
+    @property
+    def status_text(self) -> str:
+        return self._status_text
+
+    @status_text.setter
+    def status_text(self, value: str) -> None:
+        if value != self._status_text:
+            self._status_text = value
+            self.ui_dirty = True
+
+    @property
+    def message_content(self) -> list[str]:
+        return self._message_content
+
+    @message_content.setter
+    def message_content(self, value: list[str]) -> None:
+        self._message_content = value
+        if value:
+            self.ui_dirty = True
+
     callsign = property(
         safe_attrgetter("dref.callsign", default=''),
         lambda self, value: setattr(self.dref, "callsign", value)
@@ -853,7 +1131,12 @@ class PythonInterface:
             if self.fast_poll:
                 return random_connection_time(*POLL_FAST_SCHEDULE)
             else:
-                return random_connection_time(*POLL_DEFAULT_SCHEDULE)
+                # jitter stays within the normal schedule bounds
+                lo, hi = POLL_DEFAULT_SCHEDULE
+                return random_connection_time(
+                    max(lo, round(self.poll_interval * (1 - POLL_JITTER))),
+                    min(hi, round(self.poll_interval * (1 + POLL_JITTER)))
+                )
         except Exception as e:
             log(f'**** poll_frequency Error: {e}')
         return random_connection_time(*POLL_DEFAULT_SCHEDULE)
@@ -869,14 +1152,18 @@ class PythonInterface:
 
     @property
     def poll_payload(self) -> dict:
-        """Build the ACARS poll request payload for the current session."""
+        """Build the ACARS poll request payload for the current session, reused while unchanged."""
         try:
-            return {
-                'logon': self.logon,
-                'from': self.callsign,
-                'to': self.callsign,
-                'type': 'poll'
-            }
+            logon, callsign = self.logon, self.callsign
+            if self._poll_payload.get('logon') != logon or self._poll_payload.get('from') != callsign:
+                # new dict rather than in-place update: the previous one may still be in flight
+                self._poll_payload = {
+                    'logon': logon,
+                    'from': callsign,
+                    'to': callsign,
+                    'type': 'poll'
+                }
+            return self._poll_payload
         except Exception as e:
             log(f'**** poll_payload Error: {e}')
             return {}
@@ -893,12 +1180,36 @@ class PythonInterface:
     @property
     def time_to_poll(self) -> bool:
         """Check if it's time to poll messages"""
-        return perf_counter() >= self.next_poll_time
+        return self.now >= self.next_poll_time
+
+    def next_schedule(self) -> float:
+        """Delay before the next flight loop call: sooner while a task is pending or a poll is due."""
+        if self.send_task or self.poll_task:
+            return ASYNC_SCHEDULE
+        # outbox is checked at least every DEFAULT_SCHEDULE seconds
+        return max(MIN_SCHEDULE, min(DEFAULT_SCHEDULE, self.next_poll_time - self.now))
+
+    def adapt_poll_interval(self, has_data: bool) -> None:
+        """AIMD poll interval: halve it when a poll brings messages, widen it after empty polls."""
+        lo, hi = POLL_DEFAULT_SCHEDULE
+        if has_data:
+            self.poll_interval = max(lo, self.poll_interval / 2)
+        else:
+            self.poll_interval = min(hi, self.poll_interval + POLL_STEP)
+        # reschedule the upcoming poll with the new interval
+        self.next_poll_time = self.last_poll_time + self.poll_frequency
+        if DEBUG:
+            debug(f" ** poll interval: {self.poll_interval:.1f}s", "POLL")
 
     def calculate_next_poll_time(self) -> None:
         """Calculate the next poll time."""
-        debug(f" ** Calculating next poll time (fast: {self.dref.fast_poll})", "POLL")
-        self.next_poll_time = perf_counter() + self.poll_frequency
+        if DEBUG:
+            debug(f" ** Calculating next poll time (fast: {self.dref.fast_poll})", "POLL")
+        if not self.comm_ready:
+            # establishing communication: retry at a fixed pace, not on every loop
+            self.next_poll_time = self.now + POLL_RETRY
+            return
+        self.next_poll_time = self.now + self.poll_frequency
 
     @property
     def logon(self) -> str:
@@ -952,6 +1263,18 @@ class PythonInterface:
         # Messages sub window
         self.monitor.add_content_widget(title='Messages:')
         self.monitor.setup_widget(self.selected_server, self.logon)
+        self.ui_dirty = True
+        # resolved once: the widget handler then makes no xp attribute lookups
+        self.message_handlers = {
+            xp.Message_CloseButtonPushed: self.on_close,
+            xp.Msg_ButtonStateChanged: self.on_button_state,
+            xp.Msg_PushButtonPressed: self.on_push_button,
+        }
+        self.button_handlers = {
+            self.monitor.popout_button: self.on_popout,
+            self.monitor.save_button: self.on_save,
+            self.monitor.edit_button: self.on_edit,
+        }
         # Register our widget handler
         self.monitor_callback = self.monitor_widget_handler
         xp.addWidgetCallback(self.monitor.widget, self.monitor_callback)
@@ -960,52 +1283,72 @@ class PythonInterface:
         if not self.monitor:
             return 1
 
-        self.monitor.check_info_line(self.status_text)
-
-        if self.message_content:
-            self.monitor.clear_content_widget()
-            self.monitor.populate_content_widget(self.message_content)
-            self.monitor.show_content_widget()
-            self.message_content = []
-
-        if inMessage == xp.Message_CloseButtonPushed:
-            if self.monitor.window:
-                xp.setWindowIsVisible(self.monitor.window, 0)
-                return 1
+        # widget messages arrive far more often than the texts change
+        if self.ui_dirty:
+            self.ui_dirty = False
+            self.monitor.check_info_line(self.status_text)
+            if self.message_content:
+                # take the content first: a reentrant widget message must not repaint it again
+                lines, self.message_content = self.message_content, []
+                self.monitor.update_content_widget(lines)
+                self.monitor.show_content_widget()
+
+        handler = self.message_handlers.get(inMessage)
+        return handler(inParam1, inParam2) if handler else 0
+
+    def on_close(self, inParam1, inParam2) -> int:
+        if self.monitor.window:
+            xp.setWindowIsVisible(self.monitor.window, 0)
+            return 1
+        return 0
 
-        if inMessage == xp.Msg_ButtonStateChanged and inParam1 in self.monitor.server_check:
-            if inParam2:
-                for i in self.monitor.server_check.keys():
-                    if i != inParam1:
-                        xp.setWidgetProperty(i, xp.Property_ButtonState, 0)
-            else:
-                xp.setWidgetProperty(inParam1, xp.Property_ButtonState, 1)
-            self.selected_server = HOPPIE if self.monitor.server_check[inParam1] == 'hoppie' else SAYINTENTIONS
+    def on_button_state(self, inParam1, inParam2) -> int:
+        if inParam1 not in self.monitor.server_check:
+            return 0
+        if inParam2:
+            for i in self.monitor.server_check.keys():
+                if i != inParam1:
+                    xp.setWidgetProperty(i, xp.Property_ButtonState, 0)
+        else:
+            xp.setWidgetProperty(inParam1, xp.Property_ButtonState, 1)
+        self.selected_server = HOPPIE if self.monitor.server_check[inParam1] == 'hoppie' else SAYINTENTIONS
+        if DEBUG:
             debug(f"Selected server changed to: {self.selected_server}", "WIDGET")
-            self.monitor.setup_widget(self.selected_server, self.logon)
-            return 1
+        self.monitor.setup_widget(self.selected_server, self.logon)
+        # a server with a logon can start now instead of after the idle schedule
+        if self.logon and self.loop_id:
+            xp.scheduleFlightLoop(self.loop_id, interval=MIN_SCHEDULE)
+        return 1
 
-        if inMessage == xp.Msg_PushButtonPressed:
-            if inParam1 == self.monitor.popout_button:
-                self.monitor.switch_window_position()
-
-            if inParam1 == self.monitor.save_button:
-                logon = xp.getWidgetDescriptor(self.monitor.logon_input).strip()
-                debug(f"Logon entered: {logon}", "WIDGET")
-                if self.selected_server == HOPPIE:
-                    self.hoppie_logon = logon
-                else:
-                    self.sayintentions_logon = logon
-                self.save_settings()
-                self.status_text = 'settings saved'
-                self.monitor.setup_widget(self.selected_server, self.logon)
-                return 1
-            if inParam1 == self.monitor.edit_button:
-                xp.setWidgetDescriptor(self.monitor.logon_input, f"{self.logon}")
-                self.monitor.setup_widget(self.selected_server)
-                return 1
+    def on_push_button(self, inParam1, inParam2) -> int:
+        handler = self.button_handlers.get(inParam1)
+        return handler() if handler else 0
+
+    def on_popout(self) -> int:
+        self.monitor.switch_window_position()
         return 0
 
+    def on_save(self) -> int:
+        logon = xp.getWidgetDescriptor(self.monitor.logon_input).strip()
+        if DEBUG:
+            debug(f"Logon entered: {logon}", "WIDGET")
+        if self.selected_server == HOPPIE:
+            self.hoppie_logon = logon
+        else:
+            self.sayintentions_logon = logon
+        self.save_settings()
+        self.status_text = 'settings saved'
+        # wake the flight loop up now instead of waiting for the idle schedule
+        if self.loop_id:
+            xp.scheduleFlightLoop(self.loop_id, interval=MIN_SCHEDULE)
+        self.monitor.setup_widget(self.selected_server, self.logon)
+        return 1
+
+    def on_edit(self) -> int:
+        xp.setWidgetDescriptor(self.monitor.logon_input, f"{self.logon}")
+        self.monitor.setup_widget(self.selected_server)
+        return 1
+
     def open_monitor_window(self) -> None:
         if not self.monitor:
             self.create_monitor_window(100, 500)
@@ -1024,40 +1367,50 @@ class PythonInterface:
     def dict_to_lines(self, data: dict) -> list[str]:
         if not self.monitor:
             return []
-        width = self.monitor.content_width
+        width = self.monitor.content_width - self.monitor.MARGIN * 2
+        # measure each word once and keep a running line width
+        space_w = text_width(' ')
         result = []
         for k, v in data.items():
             string = f"{k}: {v}"
             lines = string.split('\n')
             for line in lines:
-                result.append('-')
+                # collect the words of the current row, joined once when it is full
+                row = ['-']
+                line_w = text_width('-')
                 words = line.split(' ')
                 for word in words:
-                    if xp.measureString(FONT, result[-1] + ' ' + word) + self.monitor.MARGIN * 2 < width:
-                        result[-1] += ' ' + word
+                    word_w = text_width(word)
+                    if line_w + space_w + word_w < width:
+                        row.append(word)
+                        line_w += space_w + word_w
                     else:
-                        result.append(word)
+                        result.append(' '.join(row))
+                        row = [word]
+                        line_w = word_w
+                result.append(' '.join(row))
         return result
 
     def load_settings(self) -> bool:
         if self.config_file.is_file():
             # read file
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = f.read()
+            data = self.config_file.read_bytes()
             # parse file
-            settings = json.loads(data).get('settings', {})
+            settings = json_loads_bytes(data).get('settings', {})
             if settings:
-                debug(f"Settings loaded: {settings} | {type(settings)}", "SETTINGS")
+                if DEBUG:
+                    debug(f"Settings loaded: {settings} | {type(settings)}", "SETTINGS")
+                    debug(f"Settings keys: {settings.keys()} | logon in keys: {'logon' in settings.keys()}", "SETTINGS")
                 # check if we have a logon
-                debug(f"Settings keys: {settings.keys()} | logon in keys: {'logon' in settings.keys()}", "SETTINGS")
                 self.hoppie_logon = settings.get('logon') if 'logon' in settings.keys() else settings.get('hoppie_logon', '')
                 self.sayintentions_logon = settings.get('sayintentions_logon', '')
                 self.selected_server = HOPPIE if settings.get('selected_server', 'hoppie') == 'hoppie' else SAYINTENTIONS
-                debug(f"Selected server: {self.selected_server} | result: {settings.get('selected_server', 'hoppie')}", "SETTINGS")
-                if self.hoppie_logon:
-                    debug(f"Hoppie Logon found: {self.hoppie_logon}")
-                if self.sayintentions_logon:
-                    debug(f"SayIntentions Logon found: {self.sayintentions_logon}")
+                if DEBUG:
+                    debug(f"Selected server: {self.selected_server} | result: {settings.get('selected_server', 'hoppie')}", "SETTINGS")
+                    if self.hoppie_logon:
+                        debug(f"Hoppie Logon found: {self.hoppie_logon}")
+                    if self.sayintentions_logon:
+                        debug(f"SayIntentions Logon found: {self.sayintentions_logon}")
                 return True
 
         # open settings window
@@ -1077,129 +1430,262 @@ class PythonInterface:
             }
         }
 
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(settings, f)
-        # check file
-        self.load_settings()
-
-    def check_async_task(self) -> None:
-        """Check the status of the async task"""
-        debug("  ** checking async task ...", "ASYNC")
-
-        if not isinstance(self.async_task, Async):
-            # sanity check
-            return
-
-        if self.async_task.pending:
-            debug("   * async task still pending ...", "ASYNC")
-            return
-
-        # async task completed
-        debug("   * async task completed ...", "ASYNC")
-        result = self.async_task.result
-        elapsed = self.async_task.elapsed
-        self.async_task = None
+        # write only: logons and server are already up to date in memory
+        with open(self.config_file, 'wb') as f:
+            f.write(json_dumps_bytes(settings))
 
-        if isinstance(result, Exception):
-            log(f" **** Async task failed: {result}")
-            self.status_text = "Connection task failed"
-            return
-
-        debug(f"   * async task result: {result} | elapsed: {round(elapsed, 3)} sec", "ASYNC")
-        if not isinstance(result, dict):
-            debug(" **** ACARS Invalid response", "ASYNC")
-            self.status_text = "ACARS Invalid response"
-            return
-
-        # process result
-        if 'error' in result:
-            log(f" **** ACARS Error: {result['error']}")
-            self.status_text = "ACARS Error"
-            return
+    def check_async_results(self) -> set[str]:
+        """Process the outcome of every connection task completed since last call.
+        Return the kinds ('send', 'poll') of the tasks read."""
+        done = set()
+        while True:
+            try:
+                kind, result = self.worker.results.get_nowait()
+            except queue.Empty:
+                return done
+            done.add(kind)
+            if kind == 'send':
+                self.send_task = None
+                self.check_send_results(result)
+                if result.ok:
+                    # a batch yields one response per message sent
+                    for payload in result.payload:
+                        if payload.get('retry'):
+                            # handled by check_send_results: re-queued, or dropped and reported
+                            continue
+                        self.process_result(result._replace(payload=payload))
+                    continue
+            else:
+                self.poll_task = None
+            self.process_result(result)
+
+    def check_send_results(self, result: Result) -> None:
+        """Update the delivery state of the batch just sent, scheduling retries on failure"""
+        batch, self.sending = self.sending, []
+        results = result.payload if result.ok else [None] * len(batch)
+        now = self.now
+        for msg, r in zip(batch, results):
+            if isinstance(r, dict) and not r.get('retry'):
+                # delivered, or failed after reaching the server: final either way
+                msg.status = OutboxStatus.SENT
+                if 'error' not in r:
+                    self.cache_info_reply(msg.payload, r)
+                continue
+            # the message never left the client (or the whole task failed): safe to send again
+            msg.attempts += 1
+            if msg.attempts >= SEND_ATTEMPTS:
+                log(f" *** Message {msg.id} dropped after {msg.attempts} attempts")
+                msg.status = OutboxStatus.SENT
+                self.status_text = "ACARS Error: message not sent"
+            else:
+                if DEBUG:
+                    debug(f"Message {msg.id} failed, retry #{msg.attempts}", "ACARS")
+                msg.status = OutboxStatus.PENDING
+                msg.locked_until = now + SEND_BACKOFF * 2 ** (msg.attempts - 1)
+        # vacuum delivered (or abandoned) messages
+        self.pending_outbox = deque(
+            (m for m in self.pending_outbox if m.status != OutboxStatus.SENT), maxlen=OUTBOX_SIZE
+        )
 
-        if not any(k in result for k in ('poll', 'response')):
-            debug(" **** ACARS Invalid response", "ASYNC")
-            self.status_text = "ACARS Invalid response"
-            return
+    def process_result(self, task_result: Result) -> None:
+        """Handle a completed connection task result"""
+        if DEBUG:
+            debug("   * async task completed ...", "ASYNC")
+            debug(f"   * async task result: {task_result.payload} | elapsed: {round(task_result.elapsed, 3)} sec", "ASYNC")
+
+        match task_result:
+            case Result(ok=False, error=error):
+                log(f" **** Async task failed: {error}")
+                self.status_text = "Connection task failed"
+                return
+            case Result(payload={'error': error}):
+                log(f" **** ACARS Error: {error}")
+                self.status_text = "ACARS Error"
+                return
+            case Result(payload={'poll': str(raw)}):
+                key = 'poll'
+            case Result(payload={'response': str(raw)}):
+                key = 'response'
+            case _:
+                debug(" **** ACARS Invalid response", "ASYNC")
+                self.status_text = "ACARS Invalid response"
+                return
 
         # process received message
-        debug(f"Received message: {result}", "ACARS")
-        key = 'poll' if 'poll' in result else 'response'
-        raw = result.get(key, '').strip()
+        if DEBUG:
+            debug(f"Received message: {task_result.payload}", "ACARS")
+        raw = raw.strip()
         if not raw:
             debug(" **** ACARS Empty poll response", "ACARS")
             return
 
-        debug(f"comm_ready: {self.comm_ready}", "ACARS")
+        if raw[:5].lower() == 'error':
+            # refused by the server (e.g. an invalid logon): report it, the inbox is for messages
+            log(f" **** ACARS {key} Error: {raw}")
+            self.status_text = "ACARS Error"
+            return
+
+        if DEBUG:
+            debug(f"comm_ready: {self.comm_ready}", "ACARS")
         if not self.comm_ready and raw.lower() == 'ok':
             # first successful poll {'poll': 'ok '}
             self.comm_ready = True
             debug("Communication ready", "ACARS")
             self.status_text = "ACARS ready"
+            # leave the handshake retry pace for the normal poll interval
+            self.next_poll_time = self.last_poll_time + self.poll_frequency
 
         else:
-            if not raw.lower().strip() == 'ok':  # to avoid logging the 'ok' response from successful empty polls
-                log(f" **** ACARS {key} Message received: {raw}")
             # check if we have chained packets before sending to inbox
+            blocks = split_hoppie_poll(raw)
+            if key == 'poll':
+                # only parsed message blocks count as traffic
+                self.adapt_poll_interval(bool(blocks))
+            if raw.lower() != 'ok':  # to avoid logging the 'ok' response from successful empty polls
+                log(f" **** ACARS {key} Message received: {raw}")
             # No structured blocks found → treat as a single message
-            blocks = split_hoppie_poll(raw) or [raw]
+            blocks = blocks or [raw]
             self.status_text = "New Message received ..." if len(blocks) == 1 else f"{len(blocks)} Chained Messages received ..."
 
             for block in blocks:
                 # create the dict from parts
-                m = {key: block}
-                if not self.inbox:
-                    self.publish_to_inbox(m)
-                else:
-                    self.pending_inbox.append(m)
-                    debug("Message added to pending_inbox", "ACARS")
-                    self.status_text = "a New Message has been queued ..."
-
-    def check_poll_or_send(self) -> None:
-        """Check if we need to poll or send messages"""
-        debug("  ** checking poll/send ...", "ASYNC")
-        debug(f"   * comm_ready: {self.comm_ready} | outbox: {self.outbox} | time_to_poll: {self.time_to_poll}", "ASYNC")
-        message = None
-        poll_payload = None
-        if self.comm_ready and self.outbox:
-            # we have a message to send
-            try:
-                message = self.outbox
-                if isinstance(message, dict):
-                    # self.outbox: '{"to": "value", "type": "value", "packet": "value"}'
-                    message['from'] = self.callsign
-                    log(f"**** ACARS Message sent (logon omitted): {message}")
-                    message['logon'] = self.logon
-                    self.outbox = None
-            except Exception as e:
-                log(f" *** Invalid message format, Error: {e}")
+                self.deliver_to_inbox({key: block})
+
+    def deliver_to_inbox(self, message: dict) -> None:
+        """Publish a message to the inbox, or queue it while the previous one is still there"""
+        if not self.inbox:
+            self.publish_to_inbox(message)
+        else:
+            self.pending_inbox.append(message)
+            debug("Message added to pending_inbox", "ACARS")
+            self.status_text = "a New Message has been queued ..."
+
+    def collect_outbox(self) -> bool:
+        """Move a message written to the outbox datarefs to the pending queue, parsed once.
+        Return True if the message was handled here instead (served from cache, or dropped)."""
+        try:
+            message = self.outbox
+            if not message:
+                if self.dref.send_queue:
+                    # unparseable legacy message: drop it instead of parsing it again on every loop
+                    self.dref.send_queue = ""
+                return False
+            # self.outbox: '{"to": "value", "type": "value", "packet": "value"}'
+            self.outbox = None
+            if str(message.get('type', '')).lower() not in MESSAGE_TYPES:
+                # the server would refuse it: drop it now instead of sending it
+                log(f"**** ACARS outbox: unknown message type {message.get('type')!r}, message dropped")
+                self.status_text = "ACARS Error: unknown message type"
+                return True
+            reply = self.cached_info_reply(message)
+            if reply:
+                log(f"**** ACARS Message served from cache: {message}")
+                self.process_result(Result(ok=True, payload=reply))
+                return True
+            if len(self.pending_outbox) == self.pending_outbox.maxlen:
+                log(f" *** Outbox full, dropping oldest message: {self.pending_outbox[0].payload}")
+            self.pending_outbox.append(OutboxMsg(message))
+        except Exception as e:
+            log(f" *** Invalid message format, Error: {e}")
+        return False
+
+    def info_key(self, message: dict) -> Optional[tuple[str, str, str]]:
+        """Cache key of an info request on the selected server, None for any other message type"""
+        if str(message.get('type', '')).lower() != 'inforeq':
+            return None
+        # replies differ between networks: never serve one server's reply for the other
+        return (
+            self.selected_server,
+            str(message.get('to', '')).upper(),
+            ' '.join(str(message.get('packet', '')).upper().split())
+        )
 
-        elif not self.comm_ready or self.time_to_poll:
+    def cached_info_reply(self, message: dict) -> Optional[dict]:
+        """Return a still valid reply to the same info request, if any"""
+        key = self.info_key(message)
+        if key not in self.info_cache:
+            return None
+        ts, reply = self.info_cache.pop(key)
+        if self.now - ts >= INFO_CACHE_TTL:
+            return None
+        # reinsert as most recently used
+        self.info_cache[key] = ts, reply
+        return reply
+
+    def cache_info_reply(self, message: dict, reply: dict) -> None:
+        """Remember the server reply to an info request"""
+        key = self.info_key(message)
+        if key is None or 'response' not in reply:
+            return
+        self.info_cache.pop(key, None)
+        self.info_cache[key] = self.now, reply
+        if len(self.info_cache) > INFO_CACHE_SIZE:
+            del self.info_cache[next(iter(self.info_cache))]
+
+    def build_send_batch(self) -> list[dict]:
+        """Mark up to SEND_BATCH_SIZE due messages as processing and return their payloads"""
+        now = self.now
+        self.sending = [
+            m for m in self.pending_outbox
+            if m.status == OutboxStatus.PENDING and m.locked_until <= now
+        ][:SEND_BATCH_SIZE]
+        # no lease on PROCESSING messages: every send task ends with a result (HTTP_TIMEOUT bounds
+        # each request) and check_send_results settles the whole batch
+        messages = []
+        for msg in self.sending:
+            msg.status = OutboxStatus.PROCESSING
+            message = {**msg.payload, 'from': self.callsign}
+            log(f"**** ACARS Message sent (logon omitted): {message}")
+            message['logon'] = self.logon
+            messages.append(message)
+        return messages
+
+    def start_task(self, kind: str, task, **kwargs) -> Future:
+        """Submit a connection task for the selected server to the worker"""
+        return self.worker.submit(kind, task, url=self.selected_server, cancel=self.worker.cancel, **kwargs)
+
+    def check_poll_or_send(self, done: set[str] = frozenset()) -> None:
+        """Check if we need to poll or send messages; done holds the kinds of tasks just read"""
+        if DEBUG:
+            debug("  ** checking poll/send ...", "ASYNC")
+            debug(f"   * comm_ready: {self.comm_ready} | outbox: {self.outbox} | time_to_poll: {self.time_to_poll}", "ASYNC")
+        messages = None
+        poll_payload = None
+        # results reported this loop (received, error): their status stays until the next loop
+        reported = bool(done)
+        if self.comm_ready:
+            reported = self.collect_outbox() or reported
+            if not self.send_task and self.pending_outbox:
+                # we have messages to send
+                messages = self.build_send_batch()
+
+        if not self.poll_task and 'poll' not in done and self.time_to_poll:
             # it's time to poll messages or to establish initial communication
             poll_payload = self.poll_payload
-            self.last_poll_time = perf_counter()
-        else:
-            debug("   * nothing to send or poll ...", "ASYNC")
-            self.status_text = "ACARS idle"
+            self.last_poll_time = self.now
+
+        if not (messages or poll_payload):
+            if not (self.send_task or self.poll_task or reported):
+                debug("   * nothing to send or poll ...", "ASYNC")
+                self.status_text = "ACARS idle"
+            return
 
-        if message or poll_payload:
-            # we have messages to send or it's time to poll
-            debug("  ** starting a new job ...", "ASYNC")
-            debug(f"   * message: {message}", "ASYNC")
+        # send and poll run concurrently on the worker event loop
+        if DEBUG:
+            debug("  ** starting new jobs ...", "ASYNC")
+            debug(f"   * messages: {messages}", "ASYNC")
             debug(f"   * poll_payload: {poll_payload}", "ASYNC")
-            self.async_task = Async(
-                Bridge.run,
-                url=self.selected_server,
-                message=message,
-                poll_payload=poll_payload,
-            )
-            self.async_task.start()
-            self.calculate_next_poll_time()
+        if messages:
+            self.send_task = self.start_task('send', Bridge.send_batch, messages=messages)
+        if poll_payload:
+            self.poll_task = self.start_task('poll', Bridge.run, poll_payload=poll_payload)
+        self.calculate_next_poll_time()
 
     def loopCallback(self, lastCall, elapsedTime, counter, refCon) -> int:
         """Loop Callback"""
 
-        start = perf_counter()
+        # single monotonic sample shared by every timing check in this call
+        self.now = start = perf_counter()
 
         # --- Hard blockers -------------------------------------------------
 
@@ -1213,19 +1699,21 @@ class PythonInterface:
             debug("**** Avionics off, aborting ...", "loopCallback")
             self.status_text = "System off"
             self.comm_ready = False
-            return DEFAULT_SCHEDULE
+            return OFF_SCHEDULE
 
         if not self.logon:
-            debug(" *** [{self.server_name}] No Logon, aborting ...", "loopCallback")
+            if DEBUG:
+                debug(f" *** [{self.server_name}] No Logon, aborting ...", "loopCallback")
             self.status_text = f"Set {self.server_name} Logon"
             self.comm_ready = False
-            return DEFAULT_SCHEDULE
+            return IDLE_SCHEDULE
 
         # --- Callsign handling --------------------------------------------
 
-        if self.send_callsign:
+        send_callsign = self.send_callsign  # one dataref read
+        if send_callsign:
             debug("  ** sending callsign ...", "loopCallback")
-            self.callsign = self.send_callsign
+            self.callsign = send_callsign
             self.send_callsign = ""
 
         if not self.callsign:
@@ -1236,11 +1724,13 @@ class PythonInterface:
 
         # --- Main processing ----------------------------------------------
 
-        debug(" *** loopCallback() ...", "loopCallback")
-        debug(f"   * callsign: {self.callsign}", "loopCallback")
-        debug(f'   * inbox: {self.inbox}', "loopCallback")
-        debug(f"   * outbox: {self.outbox}", "loopCallback")
-        debug(f"   * time to poll: {self.time_to_poll}", "loopCallback")
+        if DEBUG:
+            # gated here as well: building this string reads and parses the drefs
+            debug(
+                f" *** loopCallback() ... callsign: {self.callsign} | inbox: {self.inbox} | "
+                f"outbox: {self.outbox} | time to poll: {self.time_to_poll}",
+                "loopCallback"
+            )
 
         # check if we need to clear inbox
         if self.clear_inbox:
@@ -1253,19 +1743,20 @@ class PythonInterface:
             debug("  ** moving pending_inbox to inbox ...", "loopCallback")
             self.publish_to_inbox(self.pending_inbox.popleft())
 
-        # check if we have an async task running
-        if self.async_task:
-            self.check_async_task()
-        else:
-            # check if we need to poll and / or send messages
-            self.check_poll_or_send()
-
-        debug(
-            f"{datetime.now(timezone.utc).strftime('%H:%M:%S')} "
-            f"loopCallback() ended after {perf_counter() - start:.3f}s",
-            "loopCallback"
-        )
-        return DEFAULT_SCHEDULE
+        # process completed connection tasks (results are pushed by the worker's done callbacks)
+        done = set()
+        if self.send_task or self.poll_task:
+            done = self.check_async_results()
+        # check if we need to poll and / or send messages
+        self.check_poll_or_send(done)
+
+        elapsed = perf_counter() - start
+        if DEBUG or elapsed > SLOW_CALLBACK:
+            log(
+                f"{strftime('%H:%M:%S', gmtime())} "
+                f"loopCallback() ended after {elapsed:.3f}s"
+            )
+        return self.next_schedule()
 
     def XPluginStart(self) -> tuple[str, str, str]:
         return self.plugin_name, self.plugin_sig, self.plugin_desc
@@ -1273,10 +1764,14 @@ class PythonInterface:
     def XPluginEnable(self) -> int:
         # dref init 
         self.dref_init()
+        # connection worker
+        if not self.worker:
+            self.worker = Worker()
+            self.worker.start()
         # loopCallback
         self.loop = self.loopCallback
         self.loop_id = xp.createFlightLoop(self.loop, phase=1)
-        log(f" - {datetime.now(timezone.utc).strftime('%H:%M:%S')} Flightloop created, ID {self.loop_id}")
+        log(f" - {strftime('%H:%M:%S', gmtime())} Flightloop created, ID {self.loop_id}")
         xp.scheduleFlightLoop(self.loop_id, interval=DEFAULT_SCHEDULE)
         return 1
 
@@ -1286,6 +1781,10 @@ class PythonInterface:
     def XPluginStop(self) -> None:
         # Called once by X-Plane on quit (or when plugins are exiting as part of reload)
         xp.destroyFlightLoop(self.loop_id)
+        # cancel any in-flight connection without stalling the sim
+        if self.worker:
+            self.worker.stop()
+        Bridge.close()
         # save settings
         self.save_settings()
         # destroy widgets